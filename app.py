@@ -1,18 +1,39 @@
+import time
+
+_T0 = time.perf_counter()
+
+import bisect
+import datetime
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-
-from config import MIN_GAMES_PER_COMP
+from config import CI_HIGH_HALF_WIDTH, CI_LEVEL, CI_MED_HALF_WIDTH, LIVE_REFRESH_MS, MIN_GAMES_PER_COMP
 from engine.market_store import (
+    _parse_variant_symbol,
     get_latest_base_traits_sorted,
+    get_latest_confidence_intervals,
     get_variants_for_base_on_latest_day,
-    series_for_symbol,
+    load_history,
 )
+from engine.tick_store import TickTail
 from engine.watchlist import load_watchlist, toggle_watch
 
 
+def _load_heavy_modules():
+    # Runs on a worker thread: matplotlib and the full history are the slow part of startup.
+    import matplotlib.dates as mdates
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.figure import Figure
+
+    from engine.market_matrix import get_market_matrix
+
+    load_history()
+    get_market_matrix()
+    return Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, mdates
+
+
 class MarketApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -33,6 +54,7 @@ class MarketApp(tk.Tk):
         self.base_rows = []          # full list [(base_sym, close, games)]
         self.filtered_rows = []      # rows shown
         self.variant_rows = []       # [(variant_sym, close, games)]
+        self.ci_book = {}            # sym -> (ci_low, ci_high) on the latest day
 
         self.selected_base = None
         self.selected_symbol = None
@@ -50,10 +72,89 @@ class MarketApp(tk.Tk):
         self.hover_annot = None
         self.corner_text = None
 
+        # Chart is built once matplotlib has been imported in the background
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self.chart_frame = None
+        self.mdates = None
+        self.chart_series = []       # [(sym, x date numbers, closes, Line2D)] at full resolution
+        self.current_x = []          # x positions of current_points, for hover
+        self._resample_job = None
+        self._pending_chart = None   # ("plot", sym) / ("clear", title) requested before the chart exists
+        self._heavy_queue = queue.Queue()
+
+        # Live intraday candles
+        self.tick_tail = None
+        self._live_job = None
+
+        self._phases = []
+        self._mark_phase("tk_init")
+
         self._build_layout()
+        self._mark_phase("layout")
+
         self._load_data_and_render(auto_select=True)
+        self._mark_phase("table")
+
+        self.after_idle(self._on_first_paint)
+
+    def _mark_phase(self, name: str):
+        self._phases.append((name, time.perf_counter() - _T0))
+
+    def _report_phases(self):
+        parts = [f"{name}={t * 1000:.0f}ms" for name, t in self._phases]
+        print("[startup] " + "  ".join(parts))
+
+    def _on_first_paint(self):
+        self._mark_phase("first_paint")
+
+        def worker():
+            try:
+                self._heavy_queue.put(("ok", _load_heavy_modules()))
+            except Exception as e:
+                self._heavy_queue.put(("error", e))
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(20, self._poll_heavy_modules)
+
+    def _poll_heavy_modules(self):
+        try:
+            status, payload = self._heavy_queue.get_nowait()
+        except queue.Empty:
+            self.after(20, self._poll_heavy_modules)
+            return
+
+        if status != "ok":
+            self.chart_placeholder.config(text=f"Chart unavailable: {payload}")
+            self._mark_phase("chart_failed")
+            self._report_phases()
+            return
+
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, self.mdates = payload
+        self._mark_phase("background_load")
+        self._build_chart(Figure, FigureCanvasTkAgg, NavigationToolbar2Tk)
+
+        pending, self._pending_chart = self._pending_chart, None
+        if pending and pending[0] == "plot":
+            self._plot_symbol(pending[1])
+        elif pending:
+            self._clear_chart(pending[1])
+        else:
+            self.canvas.draw()
+        self._mark_phase("chart")
+        self._report_phases()
+
+    def _confidence_label(self, games, sym=None):
+        ci = self.ci_book.get(sym) if sym else None
+        if ci:
+            half_width = (ci[1] - ci[0]) / 2
+            if half_width <= CI_HIGH_HALF_WIDTH:
+                return "HIGH"
+            if half_width <= CI_MED_HALF_WIDTH:
+                return "MED"
+            return "LOW"
 
-    def _confidence_label(self, games):
         if games is None:
             return "UNK"
         if games >= 80:
@@ -77,17 +178,23 @@ class MarketApp(tk.Tk):
     - A "continuous future" is the aggregated instrument for a trait (e.g. /BILGEWATER:XCOMP).
     - "Contracts" are the variants (e.g. /BILGEWATER3:XCOMP, /BILGEWATER5:XCOMP).
     - Selecting an instrument plots its daily close series.
+    - "Compare contracts" overlays the continuous future and all of its contracts.
+    - Use the toolbar under the chart to zoom and pan; long histories are thinned to the
+      chart width and re-sampled at full detail for the range you zoom into.
 
 2. Price (Synthetic Close)
 
     - Each instrument has a synthetic 'close' price (0..100 in the current implementation).
     - Current project formula:
         price = 50*win_rate + 30*top4_rate + 20*pick_rate
-    - Note: In this UI we currently display only the final close price.
+    - The shaded band around the line is the {level}% confidence interval of the close,
+      bootstrapped from each day's placements (days collected before this was added have no band).
 
 3. Confidence
 
-    - Confidence is derived from the number of games/boards used in the calculation:
+    - When a confidence interval is stored, confidence comes from its half-width:
+        HIGH: <= {high}    MED: <= {med}    LOW: wider
+    - Otherwise it is derived from the number of games/boards used in the calculation:
         HIGH: games >= 80
         MED : 40 <= games < 80
         LOW : 20 <= games < 40
@@ -98,13 +205,292 @@ class MarketApp(tk.Tk):
     - Use the ☆/★ button to pin an instrument.
     - Watchlisted instruments are shown first in the table.
 
-5. Extensibility
+5. Screener
+
+    - The Screener button ranks every instrument over the whole history.
+    - Metrics: N-day change, volatility of daily returns, games growth,
+      distance from the N-day moving average.
+    - Filters: min games (latest day), exchange, futures/contracts, search.
+    - Double-click a row to open that instrument in the main chart.
+    - The Correlation button shows a heatmap of how daily returns move together,
+      for all continuous futures, all contracts, or the contracts of the selected trait.
+      "Clustered" reorders it so instruments that co-move sit next to each other.
+
+6. Live intraday candles
+
+    - Run `python collect_daily.py --stream` to write a tick per symbol after every fetched match.
+    - Tick "Live (intraday)" to show hourly OHLC candles of today's synthetic close.
+    - The chart refreshes every few seconds while the collector runs.
+
+7. Extensibility
     - Right now only the XCOMP exchange is shown.
     - The design supports adding more exchanges later (e.g., items, champions, etc.).
 """
+        help_text = help_text.format(level=round(CI_LEVEL * 100), high=CI_HIGH_HALF_WIDTH, med=CI_MED_HALF_WIDTH)
         txt.insert("1.0", help_text.strip())
         txt.configure(state="disabled")
 
+    def _open_screener(self):
+        from engine.screener import METRICS, screen
+
+        win = tk.Toplevel(self)
+        win.title("Screener — Synthetic Market")
+        win.geometry("760x560")
+        win.columnconfigure(0, weight=1)
+        win.rowconfigure(1, weight=1)
+
+        controls = ttk.Frame(win, padding=10)
+        controls.grid(row=0, column=0, sticky="ew")
+
+        metric_names = list(METRICS.keys())
+        metric_var = tk.StringVar(value=metric_names[0])
+        lookback_var = tk.StringVar(value="1")
+        min_games_var = tk.StringVar(value=str(MIN_GAMES_PER_COMP))
+        kind_var = tk.StringVar(value="all")
+        exchange_var = tk.StringVar(value="XCOMP")
+        query_var = tk.StringVar(value="")
+
+        ttk.Label(controls, text="Metric:", style="Sub.TLabel").grid(row=0, column=0, sticky="w")
+        ttk.Combobox(controls, textvariable=metric_var, values=metric_names, state="readonly", width=14).grid(
+            row=0, column=1, sticky="w", padx=(4, 12)
+        )
+        ttk.Label(controls, text="N days:", style="Sub.TLabel").grid(row=0, column=2, sticky="w")
+        ttk.Spinbox(controls, textvariable=lookback_var, from_=1, to=3650, width=5).grid(
+            row=0, column=3, sticky="w", padx=(4, 12)
+        )
+        ttk.Label(controls, text="Min games:", style="Sub.TLabel").grid(row=0, column=4, sticky="w")
+        ttk.Entry(controls, textvariable=min_games_var, width=6).grid(row=0, column=5, sticky="w", padx=(4, 12))
+
+        ttk.Label(controls, text="Type:", style="Sub.TLabel").grid(row=1, column=0, sticky="w", pady=(6, 0))
+        ttk.Combobox(
+            controls, textvariable=kind_var, values=["all", "base", "contract"], state="readonly", width=14
+        ).grid(row=1, column=1, sticky="w", padx=(4, 12), pady=(6, 0))
+        ttk.Label(controls, text="Exchange:", style="Sub.TLabel").grid(row=1, column=2, sticky="w", pady=(6, 0))
+        ttk.Combobox(controls, textvariable=exchange_var, values=["XCOMP", "(any)"], state="readonly", width=8).grid(
+            row=1, column=3, sticky="w", padx=(4, 12), pady=(6, 0)
+        )
+        ttk.Label(controls, text="Search:", style="Sub.TLabel").grid(row=1, column=4, sticky="w", pady=(6, 0))
+        ttk.Entry(controls, textvariable=query_var, width=14).grid(row=1, column=5, sticky="w", padx=(4, 12), pady=(6, 0))
+
+        table_frame = ttk.Frame(win, padding=(10, 0, 10, 0))
+        table_frame.grid(row=1, column=0, sticky="nsew")
+        table_frame.rowconfigure(0, weight=1)
+        table_frame.columnconfigure(0, weight=1)
+
+        tree = ttk.Treeview(
+            table_frame,
+            columns=("symbol", "value", "price", "conf"),
+            show="headings",
+            selectmode="browse",
+        )
+        tree.grid(row=0, column=0, sticky="nsew")
+        sb = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        sb.grid(row=0, column=1, sticky="ns")
+        tree.configure(yscrollcommand=sb.set)
+
+        tree.heading("symbol", text="Instrument")
+        tree.heading("value", text="Value")
+        tree.heading("price", text="Price")
+        tree.heading("conf", text="Confidence")
+        tree.column("symbol", width=260, anchor="w")
+        tree.column("value", width=120, anchor="center")
+        tree.column("price", width=100, anchor="center")
+        tree.column("conf", width=100, anchor="center")
+
+        status = ttk.Label(win, text="", style="Sub.TLabel", padding=10)
+        status.grid(row=2, column=0, sticky="w")
+
+        state = {"descending": True}
+
+        def run(_event=None):
+            try:
+                lookback = int(lookback_var.get())
+                min_games = int(min_games_var.get())
+            except ValueError:
+                status.config(text="N days and min games must be integers.")
+                return
+
+            exchange = exchange_var.get()
+            rows = screen(
+                metric=metric_var.get(),
+                lookback=lookback,
+                min_games=min_games,
+                exchange=None if exchange == "(any)" else exchange,
+                kind=kind_var.get(),
+                query=query_var.get(),
+                descending=state["descending"],
+            )
+
+            tree.delete(*tree.get_children())
+            for sym, value, close, games in rows:
+                tree.insert("", "end", values=(sym, f"{value:+.2f}", f"{close:.4f}", self._confidence_label(games, sym)))
+
+            tree.heading("value", text=METRICS[metric_var.get()])
+            status.config(text=f"{len(rows)} instruments. Double-click to open.")
+
+        def flip_order():
+            state["descending"] = not state["descending"]
+            run()
+
+        def open_selected(_event):
+            sel = tree.selection()
+            if sel:
+                self._select_instrument(tree.item(sel[0], "values")[0])
+
+        ttk.Button(controls, text="Run", command=run).grid(row=0, column=6, sticky="w")
+        ttk.Button(controls, text="Asc/Desc", command=flip_order).grid(row=1, column=6, sticky="w", pady=(6, 0))
+
+        tree.bind("<Double-1>", open_selected)
+        for child in controls.winfo_children():
+            if isinstance(child, (ttk.Combobox,)):
+                child.bind("<<ComboboxSelected>>", run)
+            elif isinstance(child, (ttk.Entry, ttk.Spinbox)):
+                child.bind("<Return>", run)
+
+        run()
+
+    def _open_correlation(self):
+        import numpy as np
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        from engine.correlation import cluster_order, correlation_matrix
+
+        win = tk.Toplevel(self)
+        win.title("Correlation — Synthetic Market")
+        win.geometry("900x820")
+        win.columnconfigure(0, weight=1)
+        win.rowconfigure(1, weight=1)
+
+        controls = ttk.Frame(win, padding=10)
+        controls.grid(row=0, column=0, sticky="ew")
+
+        scopes = ["Continuous futures", "Contracts of selected", "All contracts"]
+        scope_var = tk.StringVar(value=scopes[0])
+        clustered_var = tk.BooleanVar(value=True)
+        min_periods_var = tk.StringVar(value="3")
+
+        ttk.Label(controls, text="Scope:", style="Sub.TLabel").grid(row=0, column=0, sticky="w")
+        scope_menu = ttk.Combobox(controls, textvariable=scope_var, values=scopes, state="readonly", width=22)
+        scope_menu.grid(row=0, column=1, sticky="w", padx=(4, 12))
+        ttk.Label(controls, text="Min overlapping returns:", style="Sub.TLabel").grid(row=0, column=2, sticky="w")
+        ttk.Spinbox(controls, textvariable=min_periods_var, from_=2, to=3650, width=5).grid(
+            row=0, column=3, sticky="w", padx=(4, 12)
+        )
+
+        fig = Figure(figsize=(8.5, 7.5))
+        ax = fig.add_subplot(111)
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.get_tk_widget().grid(row=1, column=0, sticky="nsew")
+
+        status = ttk.Label(win, text="", style="Sub.TLabel", padding=10)
+        status.grid(row=2, column=0, sticky="w")
+
+        state = {"symbols": [], "corr": None, "n": None, "colorbar": None}
+
+        def draw(_event=None):
+            try:
+                min_periods = int(min_periods_var.get())
+            except ValueError:
+                status.config(text="Min overlapping returns must be an integer.")
+                return
+
+            scope = scope_var.get()
+            if scope == "Contracts of selected":
+                if not self.selected_base:
+                    status.config(text="Select a continuous future first.")
+                    return
+                members = [self.selected_base] + [v for v, _c, _g in self.variant_rows]
+                symbols, corr, n = correlation_matrix(symbols=members, min_periods=min_periods)
+            else:
+                kind = "base" if scope == "Continuous futures" else "contract"
+                symbols, corr, n = correlation_matrix(kind=kind, min_periods=min_periods)
+
+            if clustered_var.get() and len(symbols) > 2:
+                order = cluster_order(corr)
+                symbols = [symbols[i] for i in order]
+                corr = corr[np.ix_(order, order)]
+                n = n[np.ix_(order, order)]
+
+            state.update(symbols=symbols, corr=corr, n=n)
+
+            if state["colorbar"] is not None:
+                state["colorbar"].remove()
+                state["colorbar"] = None
+            ax.clear()
+
+            if not symbols:
+                ax.set_title("Not enough history for correlations")
+                canvas.draw()
+                status.config(text="")
+                return
+
+            im = ax.imshow(corr, cmap="RdBu_r", vmin=-1.0, vmax=1.0, interpolation="nearest")
+            state["colorbar"] = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+            ax.set_title("Correlation of daily returns")
+
+            if len(symbols) <= 60:
+                labels = [s.strip("/").replace(":XCOMP", "") for s in symbols]
+                ticks = list(range(len(symbols)))
+                ax.set_xticks(ticks)
+                ax.set_xticklabels(labels, rotation=90, fontsize=7)
+                ax.set_yticks(ticks)
+                ax.set_yticklabels(labels, fontsize=7)
+            else:
+                ax.set_xticks([])
+                ax.set_yticks([])
+
+            fig.tight_layout()
+            canvas.draw()
+            status.config(text=f"{len(symbols)} instruments. Hover a cell to see the pair.")
+
+        def on_move(event):
+            if event.inaxes != ax or state["corr"] is None or event.xdata is None:
+                return
+            i, j = int(round(event.ydata)), int(round(event.xdata))
+            symbols = state["symbols"]
+            if not (0 <= i < len(symbols) and 0 <= j < len(symbols)):
+                return
+            c = state["corr"][i, j]
+            ctxt = f"{c:+.3f}" if np.isfinite(c) else "n/a"
+            status.config(text=f"{symbols[i]}  ×  {symbols[j]}    corr {ctxt}    overlap {state['n'][i, j]} days")
+
+        ttk.Checkbutton(controls, text="Clustered", variable=clustered_var, command=draw).grid(
+            row=0, column=4, sticky="w", padx=(0, 12)
+        )
+        ttk.Button(controls, text="Draw", command=draw).grid(row=0, column=5, sticky="w")
+        scope_menu.bind("<<ComboboxSelected>>", draw)
+        canvas.mpl_connect("motion_notify_event", on_move)
+
+        draw()
+
+    def _select_instrument(self, sym: str):
+        parsed = _parse_variant_symbol(sym)
+        base = parsed[0] if parsed else sym
+
+        if not any(r[0] == base for r in self.filtered_rows):
+            self.search_var.set("")
+            self.filtered_rows = list(self.base_rows)
+
+        if not any(r[0] == base for r in self.filtered_rows):
+            self.instrument_title.config(text=sym)
+            self._clear_chart(f"{base} is not listed on the latest day")
+            return
+
+        self._refresh_table_preserve_selection(base)
+        self._on_tree_select(None)
+
+        if parsed:
+            # selection_set() queues its own <<TreeviewSelect>>; plot the contract after it.
+            def show_contract():
+                for value in self.contract_menu["values"]:
+                    if value.split("  (", 1)[0].strip() == sym:
+                        self.contract_var.set(value)
+                        break
+                self._plot_symbol(sym)
+
+            self.after_idle(show_contract)
+
     def _build_layout(self):
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=3)
@@ -123,8 +509,14 @@ class MarketApp(tk.Tk):
         ttk.Label(header_row, text="List of all supported instruments", style="Header.TLabel").grid(
             row=0, column=0, sticky="w"
         )
+        ttk.Button(header_row, text="Screener", command=self._open_screener).grid(
+            row=0, column=1, sticky="e", padx=(0, 6)
+        )
+        ttk.Button(header_row, text="Correlation", command=self._open_correlation).grid(
+            row=0, column=2, sticky="e", padx=(0, 6)
+        )
         ttk.Button(header_row, text="?", width=3, command=self._open_help).grid(
-            row=0, column=1, sticky="e"
+            row=0, column=3, sticky="e"
         )
 
         ttk.Label(left, text="", style="Sub.TLabel").grid(row=1, column=0, sticky="w", pady=(2, 10))
@@ -202,6 +594,16 @@ class MarketApp(tk.Tk):
         self.contract_menu.grid(row=0, column=1, sticky="ew", padx=(10, 0))
         self.contract_menu.bind("<<ComboboxSelected>>", self._on_contract_selected)
 
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(contract_row, text="Live (intraday)", variable=self.live_var, command=self._toggle_live).grid(
+            row=0, column=2, sticky="e", padx=(10, 0)
+        )
+
+        self.compare_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(contract_row, text="Compare contracts", variable=self.compare_var, command=self._toggle_compare).grid(
+            row=0, column=3, sticky="e", padx=(10, 0)
+        )
+
         self.stats_label = ttk.Label(
             right,
             text="Hover on the chart to see exact close price.",
@@ -209,6 +611,17 @@ class MarketApp(tk.Tk):
         )
         self.stats_label.grid(row=2, column=0, sticky="w", pady=(0, 8))
 
+        self.chart_frame = ttk.Frame(right)
+        self.chart_frame.grid(row=4, column=0, sticky="nsew")
+        self.chart_frame.rowconfigure(0, weight=1)
+        self.chart_frame.columnconfigure(0, weight=1)
+
+        self.chart_placeholder = ttk.Label(self.chart_frame, text="Loading chart…", style="Sub.TLabel", anchor="center")
+        self.chart_placeholder.grid(row=0, column=0, sticky="nsew")
+
+    def _build_chart(self, Figure, FigureCanvasTkAgg, NavigationToolbar2Tk):
+        self.chart_placeholder.destroy()
+
         self.fig = Figure(figsize=(10, 5.8))
         self.ax = self.fig.add_subplot(111)
         self.ax.set_title("Daily Chart")
@@ -222,8 +635,12 @@ class MarketApp(tk.Tk):
             fontsize=10
         )
 
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right)
-        self.canvas.get_tk_widget().grid(row=4, column=0, sticky="nsew")
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+
+        toolbar = NavigationToolbar2Tk(self.canvas, self.chart_frame, pack_toolbar=False)
+        toolbar.update()
+        toolbar.grid(row=1, column=0, sticky="ew")
 
         self.hover_annot = self.ax.annotate(
             "",
@@ -242,7 +659,10 @@ class MarketApp(tk.Tk):
         if not self.selected_base:
             return
         now_watched = toggle_watch(self.selected_base)
-        self.watchlist = load_watchlist()
+        if now_watched:
+            self.watchlist.add(self.selected_base)
+        else:
+            self.watchlist.discard(self.selected_base)
         self._update_watch_button()
 
         self._refresh_table_preserve_selection(self.selected_base)
@@ -271,6 +691,7 @@ class MarketApp(tk.Tk):
 
     def _load_data_and_render(self, auto_select: bool):
         self.base_rows = get_latest_base_traits_sorted(min_games=MIN_GAMES_PER_COMP)
+        self.ci_book = get_latest_confidence_intervals()
         if not self.base_rows:
             self.left_info.config(text="No data. Run collect_daily.py (or lower MIN_GAMES_PER_COMP).")
             self._render_table([])
@@ -299,7 +720,7 @@ class MarketApp(tk.Tk):
         rest = [r for r in rows if r[0] not in self.watchlist]
 
         def insert_row(sym, close, games):
-            conf = self._confidence_label(games)
+            conf = self._confidence_label(games, sym)
             self.tree.insert("", "end", values=(sym, f"{close:.4f}", conf))
 
         if watched:
@@ -328,7 +749,7 @@ class MarketApp(tk.Tk):
         elif self.sort_by == "conf":
             order = {"HIGH": 3, "MED": 2, "LOW": 1, "UNK": 0}
             self.filtered_rows.sort(
-                key=lambda r: order[self._confidence_label(r[2])],
+                key=lambda r: order[self._confidence_label(r[2], r[0])],
                 reverse=self.sort_desc
             )
         else:
@@ -393,7 +814,23 @@ class MarketApp(tk.Tk):
 
     def _plot_symbol(self, sym: str):
         self.selected_symbol = sym
-        self.current_points = series_for_symbol(sym)  # [(day, close, games), ...]
+        if self.canvas is None:
+            self.instrument_title.config(text=sym)
+            self._pending_chart = ("plot", sym)
+            return
+
+        if self.live_var.get():
+            self._plot_live(sym)
+            return
+
+        # Only reached once the chart exists, i.e. after the background load imported these.
+        import numpy as np
+
+        from engine.market_matrix import get_market_matrix
+
+        # Every series and the CI band come from the cached matrix: no per-symbol history scans.
+        m = get_market_matrix()
+        self.current_points = m.series(sym)  # [(day, close, games), ...]
 
         self.instrument_title.config(text=sym)
 
@@ -401,18 +838,90 @@ class MarketApp(tk.Tk):
             self._clear_chart(f"No series for {sym}")
             return
 
-        days = [d for d, _, _ in self.current_points]
-        closes = [c for _, c, _ in self.current_points]
-        x = list(range(len(days)))
+        symbols = [sym]
+        if self.compare_var.get() and self.selected_base:
+            symbols += [s for s in [self.selected_base] + [v for v, _c, _g in self.variant_rows] if s != sym]
 
         self.ax.clear()
-        self.ax.plot(x, closes, marker="o", linewidth=1.8)
+        self.chart_series = []
+        for s in symbols:
+            points = self.current_points if s == sym else m.series(s)
+            if not points:
+                continue
+            x = np.array([self._day_num(d) for d, _c, _g in points])
+            y = np.array([c for _d, c, _g in points])
+            primary = s == sym
+            (line,) = self.ax.plot([], [], linewidth=1.8 if primary else 1.0, alpha=1.0 if primary else 0.75, label=s)
+            self.chart_series.append((s, x, y, line))
+
+        self.current_x = self.chart_series[0][1].tolist()
+
+        band = {day: (lo, hi) for day, lo, hi in m.band(sym)}
+        if band:
+            bdays = [d for d, _c, _g in self.current_points if d in band]
+            self.ax.fill_between(
+                [self._day_num(d) for d in bdays],
+                [band[d][0] for d in bdays],
+                [band[d][1] for d in bdays],
+                alpha=0.2,
+                linewidth=0,
+                label=f"{round(CI_LEVEL * 100)}% CI",
+            )
+
+        x_min = min(s[1][0] for s in self.chart_series)
+        x_max = max(s[1][-1] for s in self.chart_series)
+        self.ax.set_xlim(x_min - 0.5, x_max + 0.5)
+        y_all = np.concatenate([s[2] for s in self.chart_series])
+        pad = max(float(np.ptp(y_all)) * 0.05, 0.5)
+        self.ax.set_ylim(float(y_all.min()) - pad, float(y_all.max()) + pad)
+
+        locator = self.mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(self.mdates.ConciseDateFormatter(locator))
+
         self.ax.grid(True, alpha=0.3)
-        self.ax.set_title("Daily Chart")
+        self.ax.set_title("Daily Chart" if len(self.chart_series) == 1 else "Daily Chart (compare)")
         self.ax.set_ylabel("Price")
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels(days)
+        if len(self.chart_series) > 1:
+            self.ax.legend(fontsize=8, loc="upper left", bbox_to_anchor=(0.0, 0.93))
+
+        self._resample_series()
+        # Axes.clear() drops its callbacks, so the zoom/pan hook is reattached on every plot.
+        self.ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
 
+        self._add_hover_artists()
+
+        self.fig.tight_layout()
+        self.canvas.draw()
+
+    def _day_num(self, day: str) -> float:
+        return float(self.mdates.date2num(datetime.date.fromisoformat(day)))
+
+    def _resample_series(self):
+        # Each line only holds as many points as the axes is wide, for the currently visible range.
+        from engine.downsample import downsample_window
+
+        x_min, x_max = self.ax.get_xlim()
+        width = max(int(self.ax.bbox.width), 100)
+        for _sym, x, y, line in self.chart_series:
+            xs, ys = downsample_window(x, y, x_min, x_max, width)
+            line.set_data(xs, ys)
+            line.set_marker("o" if len(xs) <= 60 else "")
+            line.set_markersize(5 if line.get_linewidth() > 1.5 else 3)
+
+    def _on_xlim_changed(self, _ax):
+        if self._resample_job is not None:
+            self.after_cancel(self._resample_job)
+        self._resample_job = self.after(40, self._apply_resample)
+
+    def _apply_resample(self):
+        self._resample_job = None
+        if not self.chart_series:
+            return
+        self._resample_series()
+        self.canvas.draw_idle()
+
+    def _add_hover_artists(self):
         self.corner_text = self.ax.text(
             0.01, 0.99, "",
             transform=self.ax.transAxes,
@@ -431,11 +940,84 @@ class MarketApp(tk.Tk):
         )
         self.hover_annot.set_visible(False)
 
+    def _toggle_compare(self):
+        if self.selected_symbol:
+            self._plot_symbol(self.selected_symbol)
+
+    def _toggle_live(self):
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+            self._live_job = None
+
+        if self.live_var.get():
+            self.tick_tail = None
+            self._refresh_live()
+        elif self.selected_symbol:
+            self._plot_symbol(self.selected_symbol)
+
+    def _refresh_live(self):
+        today = datetime.date.today().isoformat()
+        if self.tick_tail is None or not self.tick_tail.path.endswith(f"{today}.jsonl"):
+            self.tick_tail = TickTail(today)
+
+        changed = self.tick_tail.poll()
+        if self.selected_symbol and (changed and self.selected_symbol in changed or not self.current_points):
+            self._plot_symbol(self.selected_symbol)
+
+        self._live_job = self.after(LIVE_REFRESH_MS, self._refresh_live)
+
+    def _plot_live(self, sym: str):
+        if self.tick_tail is None:
+            self.tick_tail = TickTail()
+            self.tick_tail.poll()
+
+        bars = self.tick_tail.bars_for_symbol(sym)  # [(start_ts, open, high, low, close, games), ...]
+        self.instrument_title.config(text=sym)
+
+        if not bars:
+            self._clear_chart(f"No intraday ticks for {sym} today (run collect_daily.py --stream)")
+            return
+
+        labels = [datetime.datetime.fromtimestamp(b[0]).strftime("%H:%M") for b in bars]
+        self.current_points = [(label, b[4], b[5]) for label, b in zip(labels, bars)]
+        x = list(range(len(bars)))
+        self.current_x = x
+        self.chart_series = []
+
+        opens = [b[1] for b in bars]
+        highs = [b[2] for b in bars]
+        lows = [b[3] for b in bars]
+        closes = [b[4] for b in bars]
+        colors = ["tab:green" if c >= o else "tab:red" for o, c in zip(opens, closes)]
+
+        self.ax.clear()
+        self.ax.vlines(x, lows, highs, colors=colors, linewidth=1.0)
+        self.ax.bar(
+            x,
+            [max(abs(c - o), 1e-3) for o, c in zip(opens, closes)],
+            bottom=[min(o, c) for o, c in zip(opens, closes)],
+            color=colors,
+            width=0.6,
+        )
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_title("Intraday Chart (live)")
+        self.ax.set_ylabel("Price")
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels(labels)
+
+        self._add_hover_artists()
+
         self.fig.tight_layout()
         self.canvas.draw()
 
     def _clear_chart(self, title: str):
         self.current_points = []
+        self.current_x = []
+        self.chart_series = []
+        if self.canvas is None:
+            self._pending_chart = ("clear", title)
+            return
+
         self.ax.clear()
         self.ax.set_title(title)
         self.ax.set_ylabel("Price")
@@ -454,17 +1036,21 @@ class MarketApp(tk.Tk):
         if event.xdata is None:
             return
 
-        idx = int(round(event.xdata))
-        if idx < 0 or idx >= len(self.current_points):
+        xs = self.current_x
+        if event.xdata < xs[0] - 0.5 or event.xdata > xs[-1] + 0.5:
             if self.hover_annot.get_visible():
                 self.hover_annot.set_visible(False)
                 self.corner_text.set_text("")
                 self.canvas.draw_idle()
             return
 
+        idx = bisect.bisect_left(xs, event.xdata)
+        if idx >= len(xs) or (idx > 0 and event.xdata - xs[idx - 1] < xs[idx] - event.xdata):
+            idx -= 1
+
         day, close, games = self.current_points[idx]
 
-        self.hover_annot.xy = (idx, close)
+        self.hover_annot.xy = (xs[idx], close)
         self.hover_annot.set_text(f"{close:.4f}")
         self.hover_annot.set_visible(True)
 
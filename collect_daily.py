@@ -1,19 +1,38 @@
 import os
+import sys
 import json
 from config import CHALLENGER_PLAYER_LIMIT, MATCHES_PER_PLAYER, TOP_N_TRAITS, RAW_DAILY_PATH
-from config import MIN_GAMES_PER_COMP
+from config import MIN_GAMES_PER_COMP, CI_METHOD, CI_LEVEL, BOOTSTRAP_SAMPLES
+from config import ADAPTIVE_TARGET_SE, ADAPTIVE_BOARD_COVERAGE, ADAPTIVE_MIN_MATCHES, ADAPTIVE_CHECK_EVERY, ADAPTIVE_TAIL_MARGIN
 from api.tft_league import get_challenger_entries
 from api.tft_match import get_match_ids_by_puuid, get_match
-from engine.stats_engine import aggregate_comp_stats
+from engine.stats_engine import CompStatsAccumulator, close_confidence_intervals
 from engine.pricing import price_from_w4p
-from engine.market_store import upsert_day_book
+from engine.market_store import compute_base_trait_book_for_day, _parse_variant_symbol, upsert_day_book
+from engine.tick_store import append_ticks
+from engine.sampling import AdaptiveScheduler
 
-def main():
-    entries = get_challenger_entries()[:CHALLENGER_PLAYER_LIMIT]
-    puuids = [e["puuid"] for e in entries]
+def _stream_tick(acc: CompStatsAccumulator, touched: set[str], members: dict[str, set[str]]) -> int:
+    # Ticks only for symbols this match moved, plus the continuous futures they roll up into.
+    # Only those symbols and the sibling contracts of their bases are priced; members maps
+    # each base to every contract seen so far today.
+    touched_bases = set()
+    for sym in touched:
+        parsed = _parse_variant_symbol(sym)
+        if parsed:
+            members.setdefault(parsed[0], set()).add(sym)
+            touched_bases.add(parsed[0])
+
+    needed = set(touched).union(*(members[b] for b in touched_bases))
+    book = acc.book(MIN_GAMES_PER_COMP, symbols=needed)
 
+    rows = {sym: book[sym] for sym in touched if sym in book}
+    rows.update(compute_base_trait_book_for_day(book))
+
+    return append_ticks(rows)
+
+def _fetch_fixed(puuids: list[str], on_match):
     seen = set()
-    matches = []
 
     for i, puuid in enumerate(puuids, start=1):
         print(f"[{i}/{len(puuids)}] fetching match ids...")
@@ -22,14 +41,73 @@ def main():
             if mid in seen:
                 continue
             seen.add(mid)
-            matches.append(get_match(mid))
+            on_match(get_match(mid))
+
+def _fetch_adaptive(puuids: list[str], acc: CompStatsAccumulator, on_match):
+    sched = AdaptiveScheduler(
+        puuids,
+        top_n_traits=TOP_N_TRAITS,
+        target_se=ADAPTIVE_TARGET_SE,
+        board_coverage=ADAPTIVE_BOARD_COVERAGE,
+        min_matches=ADAPTIVE_MIN_MATCHES,
+        tail_margin=ADAPTIVE_TAIL_MARGIN,
+        lookahead=MATCHES_PER_PLAYER * 5,
+    )
+
+    while True:
+        if sched.wants_ids():
+            puuid = sched.next_player()
+            new = sched.add_id_list(puuid, get_match_ids_by_puuid(puuid, count=MATCHES_PER_PLAYER))
+            print(f"[ids {sched.id_calls}/{len(puuids)}] {new} new match ids")
+            continue
+
+        mid = sched.next_match()
+        if mid is None:
+            print("Match queue exhausted.")
+            break
+
+        match = get_match(mid)
+        on_match(match)
+        sched.record_match(mid, match)
+
+        if sched.match_calls % ADAPTIVE_CHECK_EVERY == 0:
+            done, coverage, under, near = sched.check_precision(acc, MIN_GAMES_PER_COMP)
+            print(
+                f"[matches {sched.match_calls}] confident coverage {coverage:.1%}, "
+                f"under-sampled comps {under}, comps near the {MIN_GAMES_PER_COMP}-game cut {near}"
+            )
+            if done:
+                print(f"Target precision reached (SE <= {ADAPTIVE_TARGET_SE} on {coverage:.1%} of priced boards).")
+                break
+
+    fixed_budget = len(puuids) * (1 + MATCHES_PER_PLAYER)
+    print(f"API calls: {sched.id_calls} id lists + {sched.match_calls} matches (fixed walk budget up to {fixed_budget})")
+
+def main(stream: bool = False, adaptive: bool = False):
+    entries = get_challenger_entries()[:CHALLENGER_PLAYER_LIMIT]
+    puuids = [e["puuid"] for e in entries]
+
+    matches = []
+    acc = CompStatsAccumulator(TOP_N_TRAITS)
+    members: dict[str, set[str]] = {}
+
+    def on_match(match: dict):
+        matches.append(match)
+        touched = acc.add_match(match)
+        if stream:
+            _stream_tick(acc, touched, members)
+
+    if adaptive:
+        _fetch_adaptive(puuids, acc, on_match)
+    else:
+        _fetch_fixed(puuids, on_match)
 
     os.makedirs("data", exist_ok=True)
 
     with open(RAW_DAILY_PATH, "w", encoding="utf-8") as f:
         json.dump(matches, f)
 
-    stats = aggregate_comp_stats(matches, top_n_traits=TOP_N_TRAITS)
+    stats = acc.stats()
 
     symbol_to_row = {}
 
@@ -41,8 +119,21 @@ def main():
         close = price_from_w4p(s["win_rate"], s["top4_rate"], s["pick_rate"])
         symbol_to_row[sym] = {"close": close, "games": games}
 
+    traded = {sym: stats[sym] for sym in symbol_to_row}
+    intervals = close_confidence_intervals(traded, method=CI_METHOD, level=CI_LEVEL, n_boot=BOOTSTRAP_SAMPLES)
+    for sym, (lo, hi) in intervals.items():
+        symbol_to_row[sym]["ci_low"] = lo
+        symbol_to_row[sym]["ci_high"] = hi
+
+    if stream:
+        # Closing tick for every symbol: pick_rate moves with every match, so an untouched
+        # symbol's last intraday tick would otherwise drift from the stored close.
+        closing = dict(symbol_to_row)
+        closing.update(compute_base_trait_book_for_day(symbol_to_row))
+        append_ticks(closing)
+
     day = upsert_day_book(symbol_to_row)
     print(f"Saved closes for day {day}. Symbols (filtered): {len(symbol_to_row)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(stream="--stream" in sys.argv[1:], adaptive="--adaptive" in sys.argv[1:])
\ No newline at end of file
@@ -11,4 +11,27 @@ TOP_N_TRAITS = 1
 
 DATA_DIR = "data"
 MARKET_HISTORY_PATH = f"{DATA_DIR}/market_history.json"
-RAW_DAILY_PATH = f"{DATA_DIR}/daily_raw.json"
\ No newline at end of file
+RAW_DAILY_PATH = f"{DATA_DIR}/daily_raw.json"
+LATEST_BOOK_PATH = f"{DATA_DIR}/latest_book.json"
+
+TICKS_DIR = f"{DATA_DIR}/ticks"
+TICK_BAR_SECONDS = 3600
+LIVE_REFRESH_MS = 5000
+
+CI_METHOD = "bootstrap"   # "bootstrap" / "analytic"
+CI_LEVEL = 0.95
+BOOTSTRAP_SAMPLES = 1000
+CI_HIGH_HALF_WIDTH = 6.0
+CI_MED_HALF_WIDTH = 8.5
+
+# Adaptive collection (collect_daily.py --adaptive)
+ADAPTIVE_TARGET_SE = 2.5          # standard error of a close, in price points
+ADAPTIVE_BOARD_COVERAGE = 0.75    # share of priced boards that must sit in confident symbols (a full day reaches ~0.8)
+ADAPTIVE_MIN_MATCHES = 200
+ADAPTIVE_CHECK_EVERY = 25
+ADAPTIVE_TAIL_MARGIN = 0.25       # keep going while a comp headed for the book has < MIN_GAMES_PER_COMP * 1.25 games
+
+# Append-only journals for market_history.json / watchlist.json
+JOURNAL_FSYNC_EVERY = 8
+JOURNAL_FSYNC_INTERVAL_S = 2.0
+JOURNAL_COMPACT_EVERY = 64
\ No newline at end of file
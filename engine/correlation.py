@@ -0,0 +1,76 @@
+import numpy as np
+
+from engine.market_matrix import MarketMatrix, get_market_matrix
+
+_cache: dict = {"matrix": None, "min_periods": None, "result": None}
+
+
+def return_matrix(m: MarketMatrix) -> np.ndarray:
+    # Day-over-day returns; a return is only defined when both adjacent days traded,
+    # so a missing day leaves NaNs instead of a return bridged across the gap.
+    prev = m.close[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = (m.close[1:] - prev) / prev
+    rets[~np.isfinite(rets)] = np.nan
+    return rets
+
+
+def pairwise_correlation(rets: np.ndarray, min_periods: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    # Pairwise-complete Pearson correlation for all columns in one pass of masked matrix products.
+    mask = ~np.isnan(rets)
+    x = np.where(mask, rets, 0.0)
+    w = mask.astype(float)
+
+    n = w.T @ w
+    sx = x.T @ w                 # sum of column i over the days column j also traded
+    sxx = (x * x).T @ w
+    sxy = x.T @ x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sx.T / n
+        var_i = sxx - sx**2 / n
+        var_j = var_i.T
+        corr = cov / np.sqrt(var_i * var_j)
+
+    corr[(n < min_periods) | ~np.isfinite(corr)] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(np.diag(n) >= min_periods, 1.0, np.nan))
+    return corr, n.astype(int)
+
+
+def cluster_order(corr: np.ndarray) -> np.ndarray:
+    # Angular ordering in the plane of the two leading eigenvectors keeps co-moving symbols together.
+    if len(corr) < 3:
+        return np.arange(len(corr))
+    c = np.nan_to_num(corr, nan=0.0)
+    _vals, vecs = np.linalg.eigh(c)
+    return np.argsort(np.arctan2(vecs[:, -2], vecs[:, -1]), kind="stable")
+
+
+def correlation_matrix(
+    symbols: list[str] | None = None,
+    kind: str = "base",
+    min_periods: int = 3,
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    m = get_market_matrix()
+    if len(m.days) < 2:
+        return [], np.empty((0, 0)), np.empty((0, 0), dtype=int)
+
+    # The full matrix is computed once per market matrix and sliced per request.
+    if _cache["matrix"] is not m or _cache["min_periods"] != min_periods:
+        _cache["result"] = pairwise_correlation(return_matrix(m), min_periods)
+        _cache["matrix"] = m
+        _cache["min_periods"] = min_periods
+    corr, n = _cache["result"]
+
+    if symbols is not None:
+        cols = [j for j in (m.column(s) for s in symbols) if j is not None]
+    elif kind == "base":
+        cols = list(np.flatnonzero(m.is_base))
+    elif kind == "contract":
+        cols = list(np.flatnonzero(~m.is_base))
+    else:
+        cols = list(range(len(m.symbols)))
+
+    idx = np.array(cols, dtype=int)
+    return [m.symbols[j] for j in idx], corr[np.ix_(idx, idx)], n[np.ix_(idx, idx)]
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets: keeps first/last points and, per bucket, the point
+    # forming the largest triangle with the previous pick and the next bucket's mean.
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0] = 0
+    out[-1] = n - 1
+
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], max(edges[b + 1], edges[b] + 1)
+        nlo, nhi = edges[b + 1], edges[b + 2] if b + 2 < len(edges) else n
+        nhi = max(nhi, nlo + 1)
+        cx = x[nlo:nhi].mean()
+        cy = y[nlo:nhi].mean()
+
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        out[b + 1] = a
+
+    return out
+
+
+def downsample_window(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_min: float,
+    x_max: float,
+    n_out: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Visible slice plus one neighbour on each side so lines run off the edges of the axes.
+    lo = max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x_max, side="right")) + 1, len(x))
+    xs = x[lo:hi]
+    ys = y[lo:hi]
+    idx = lttb_indices(xs, ys, n_out)
+    return xs[idx], ys[idx]
@@ -0,0 +1,268 @@
+import atexit
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Any, Callable
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    # Inter-process lock on a sidecar "<path>.lock" file (flock on POSIX, msvcrt on Windows).
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._f = open(self.path, "a+b")
+        if os.name == "nt":
+            self._f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        else:
+            fcntl.flock(self._f.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if os.name == "nt":
+                self._f.seek(0)
+                msvcrt.locking(self._f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._f.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._f.close()
+            self._f = None
+
+
+def _target_mode(path: str) -> int:
+    # mkstemp creates 0600 files; keep the target's mode (or the umask default for new files).
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_json(path: str, obj: Any, indent: int | None = None) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, _target_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def file_key(path: str) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class JournalStore:
+    # State = JSON snapshot at `path` + ops appended to "<path>.journal".
+    # Ops must be idempotent: a crash between compaction's rename and the journal
+    # truncation replays them onto a snapshot that already contains them.
+    def __init__(
+        self,
+        path: str,
+        empty: Callable[[], Any],
+        decode: Callable[[Any], Any],
+        encode: Callable[[Any], Any],
+        apply_op: Callable[[Any, dict], None],
+        fsync_every: int = 8,
+        fsync_interval: float = 2.0,
+        compact_every: int = 64,
+        indent: int | None = None,
+        corrupt_as_empty: bool = False,
+    ):
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self.lock = FileLock(f"{path}.lock")
+        self._thread_lock = threading.RLock()   # the terminal loads history from a worker thread too
+        self.empty = empty
+        self.decode = decode
+        self.encode = encode
+        self.apply_op = apply_op
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self.indent = indent
+        self.corrupt_as_empty = corrupt_as_empty
+
+        self.state = empty()
+        self._snapshot_key = None
+        self._offset = 0          # bytes of the journal already applied to self.state
+        self._ops = 0             # ops in the journal since the last compaction
+        self._loaded = False
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        atexit.register(self.sync)
+
+    def version(self) -> tuple:
+        return (file_key(self.path), file_key(self.journal_path))
+
+    def mtime_ns(self) -> int | None:
+        keys = [k for k in self.version() if k is not None]
+        return max(k[0] for k in keys) if keys else None
+
+    def load(self) -> Any:
+        with self._thread_lock:
+            snap_key, journal_key = self.version()
+            journal_size = journal_key[1] if journal_key else 0
+            if self._loaded and snap_key == self._snapshot_key and journal_size == self._offset:
+                return self.state
+
+            with self.lock:
+                self._refresh()
+            return self.state
+
+    def _refresh(self):
+        # Caller holds the lock.
+        snap_key = file_key(self.path)
+        if not self._loaded or snap_key != self._snapshot_key:
+            self.state = self._read_snapshot()
+            self._snapshot_key = snap_key
+            self._offset = 0
+            self._ops = 0
+            self._loaded = True
+
+        journal_key = file_key(self.journal_path)
+        size = journal_key[1] if journal_key else 0
+        if size < self._offset:
+            # Journal was truncated by a compaction we did not see the snapshot of; start over.
+            self.state = self._read_snapshot()
+            self._offset = 0
+            self._ops = 0
+        if size > self._offset:
+            self._replay_from(self._offset)
+
+    def _read_snapshot(self) -> Any:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return self.decode(json.load(f))
+        except FileNotFoundError:
+            return self.empty()
+        except ValueError:
+            # Opt-in: a corrupt snapshot reads as empty and is replaced at the next compaction.
+            # Off for stores where that would throw away data that is still recoverable by hand.
+            if self.corrupt_as_empty:
+                return self.empty()
+            raise
+
+    def _replay_from(self, offset: int):
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+
+        # A torn last line (crash mid-append) is ignored until it is completed or compacted away.
+        end = chunk.rfind(b"\n") + 1
+        for raw in chunk[:end].splitlines():
+            try:
+                op = json.loads(raw)
+            except ValueError:
+                continue
+            self.apply_op(self.state, op)
+            self._ops += 1
+        self._offset = offset + end
+
+    def read_locked(self, fn: Callable[[Any], Any]) -> Any:
+        # Runs fn on the up-to-date state while holding the store lock, so nothing can commit meanwhile.
+        with self._thread_lock, self.lock:
+            self._refresh()
+            return fn(self.state)
+
+    def update(
+        self,
+        decide: Callable[[Any], list[dict]],
+        on_commit: Callable[[Any], None] | None = None,
+    ) -> list[dict]:
+        # Locked read-modify-append: the ops are chosen from state no other process can change first.
+        with self._thread_lock, self.lock:
+            self._refresh()
+            ops = decide(self.state)
+            for op in ops:
+                self._append_locked(op)
+
+            # Derived files written here stay ordered with the ops across processes.
+            if ops and on_commit is not None:
+                on_commit(self.state)
+        return ops
+
+    def append(self, op: dict, on_commit: Callable[[Any], None] | None = None) -> Any:
+        self.update(lambda _state: [op], on_commit=on_commit)
+        return self.state
+
+    def _append_locked(self, op: dict):
+        # Caller holds the lock and has refreshed state.
+        line = (json.dumps(op) + "\n").encode("utf-8")
+        os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+        with open(self.journal_path, "ab") as f:
+            if f.tell() > self._offset:
+                # drop a torn tail so this op starts on its own line
+                f.truncate(self._offset)
+            f.write(line)
+            f.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                os.fsync(f.fileno())
+                self._unsynced = 0
+                self._last_sync = time.monotonic()
+
+        self.apply_op(self.state, op)
+        self._offset += len(line)
+        self._ops += 1
+
+        if self._ops >= self.compact_every:
+            self._compact()
+
+    def sync(self):
+        with self._thread_lock:
+            if not self._unsynced or not os.path.exists(self.journal_path):
+                return
+            with open(self.journal_path, "ab") as f:
+                os.fsync(f.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def compact(self, if_pending: bool = False):
+        with self._thread_lock, self.lock:
+            self._refresh()
+            if if_pending and not self._ops:
+                return
+            self._compact()
+
+    def _compact(self):
+        # Caller holds the lock and has refreshed state.
+        atomic_write_json(self.path, self.encode(self.state), indent=self.indent)
+        with open(self.journal_path, "wb") as f:
+            os.fsync(f.fileno())
+        self._snapshot_key = file_key(self.path)
+        self._offset = 0
+        self._ops = 0
+        self._unsynced = 0
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.market_store import (
+    _normalize_day_book,
+    _parse_variant_symbol,
+    compute_base_trait_book_for_day,
+    history_version,
+    list_days,
+    load_history,
+)
+
+
+@dataclass(frozen=True)
+class MarketMatrix:
+    days: list[str]
+    symbols: list[str]
+    close: np.ndarray        # (n_days, n_symbols), NaN where the symbol did not trade
+    games: np.ndarray        # (n_days, n_symbols), NaN where unknown / not traded
+    is_base: np.ndarray      # (n_symbols,) bool, True for continuous futures
+    exchange: np.ndarray     # (n_symbols,) str, e.g. "XCOMP"
+    ci_low: np.ndarray       # (n_days, n_symbols), NaN where no confidence interval was stored
+    ci_high: np.ndarray
+
+    def column(self, symbol: str) -> int | None:
+        try:
+            return self.symbols.index(symbol)
+        except ValueError:
+            return None
+
+    def series(self, symbol: str) -> list[tuple[str, float, int | None]]:
+        j = self.column(symbol)
+        if j is None:
+            return []
+        rows = np.flatnonzero(~np.isnan(self.close[:, j]))
+        return [
+            (self.days[i], float(self.close[i, j]), None if np.isnan(self.games[i, j]) else int(self.games[i, j]))
+            for i in rows
+        ]
+
+    def band(self, symbol: str) -> list[tuple[str, float, float]]:
+        j = self.column(symbol)
+        if j is None:
+            return []
+        rows = np.flatnonzero(~np.isnan(self.ci_low[:, j]))
+        return [(self.days[i], float(self.ci_low[i, j]), float(self.ci_high[i, j])) for i in rows]
+
+
+def symbol_exchange(sym: str) -> str:
+    if ":" not in sym:
+        return ""
+    return sym.rsplit(":", 1)[1]
+
+
+def build_market_matrix(history: dict) -> MarketMatrix:
+    days = list_days(history)
+
+    books = []
+    symbols: set[str] = set()
+    for day in days:
+        day_book = _normalize_day_book(history[day])
+        day_book.update(compute_base_trait_book_for_day(day_book))
+        books.append(day_book)
+        symbols.update(day_book.keys())
+
+    ordered = sorted(symbols)
+    col = {sym: j for j, sym in enumerate(ordered)}
+
+    close = np.full((len(days), len(ordered)), np.nan)
+    games = np.full((len(days), len(ordered)), np.nan)
+    ci_low = np.full((len(days), len(ordered)), np.nan)
+    ci_high = np.full((len(days), len(ordered)), np.nan)
+    for i, book in enumerate(books):
+        for sym, row in book.items():
+            j = col[sym]
+            close[i, j] = row["close"]
+            if row["games"] is not None:
+                games[i, j] = row["games"]
+            if "ci_low" in row:
+                ci_low[i, j] = row["ci_low"]
+                ci_high[i, j] = row["ci_high"]
+
+    is_base = np.array(
+        [s.startswith("/") and s.endswith(":XCOMP") and _parse_variant_symbol(s) is None for s in ordered],
+        dtype=bool,
+    )
+    exchange = np.array([symbol_exchange(s) for s in ordered], dtype=str)
+
+    return MarketMatrix(
+        days=days,
+        symbols=ordered,
+        close=close,
+        games=games,
+        is_base=is_base,
+        exchange=exchange,
+        ci_low=ci_low,
+        ci_high=ci_high,
+    )
+
+
+_cache: dict = {"key": None, "matrix": None}
+
+
+def get_market_matrix() -> MarketMatrix:
+    # Rebuilt only when the history snapshot or its journal changes on disk.
+    key = history_version()
+    if _cache["matrix"] is None or _cache["key"] != key:
+        _cache["matrix"] = build_market_matrix(load_history())
+        _cache["key"] = key
+    return _cache["matrix"]
@@ -1,16 +1,40 @@
 import json
-import os
 import datetime
 from typing import Any
-from config import MARKET_HISTORY_PATH
+from config import JOURNAL_FSYNC_EVERY, JOURNAL_FSYNC_INTERVAL_S
+from config import LATEST_BOOK_PATH, MARKET_HISTORY_PATH
+from engine.journal import JournalStore, file_key, atomic_write_json
+
+
+def _apply_history_op(history: dict, op: dict) -> None:
+    if op.get("op") == "upsert":
+        # New day dict rather than update(): readers may still hold the old one.
+        day = op["day"]
+        history[day] = {**history.get(day, {}), **op["rows"]}
+
+
+_history_store = JournalStore(
+    MARKET_HISTORY_PATH,
+    empty=dict,
+    decode=lambda data: data if isinstance(data, dict) else {},
+    encode=lambda history: history,
+    apply_op=_apply_history_op,
+    fsync_every=JOURNAL_FSYNC_EVERY,
+    fsync_interval=JOURNAL_FSYNC_INTERVAL_S,
+    # One upsert per daily run: compact every time so the tracked market_history.json always
+    # holds every day; the journal only covers the window between append and rename.
+    compact_every=1,
+    indent=2,
+)
 
 
 def load_history() -> dict:
-    if not os.path.exists(MARKET_HISTORY_PATH):
-        return {}
+    # Snapshot + journal, re-read only when either changes; callers must treat the result as read-only.
+    return _history_store.load()
+
 
-    with open(MARKET_HISTORY_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def history_version() -> tuple:
+    return _history_store.version()
 
 
 def _normalize_day_book(book: dict[str, Any]) -> dict[str, dict]:
@@ -20,6 +44,9 @@ def _normalize_day_book(book: dict[str, Any]) -> dict[str, dict]:
             close = float(val.get("close", 0.0))
             games = val.get("games", None)
             out[sym] = {"close": close, "games": int(games) if games is not None else None}
+            if val.get("ci_low") is not None and val.get("ci_high") is not None:
+                out[sym]["ci_low"] = float(val["ci_low"])
+                out[sym]["ci_high"] = float(val["ci_high"])
         else:
             out[sym] = {"close": float(val), "games": None}
     return out
@@ -57,6 +84,7 @@ def _parse_variant_symbol(sym: str) -> tuple[str, str] | None:
 
 def compute_base_trait_book_for_day(day_book: dict[str, dict]) -> dict[str, dict]:
     buckets: dict[str, list[tuple[float, int | None]]] = {}
+    half_widths: dict[str, list[float | None]] = {}
 
     for sym, row in day_book.items():
         parsed = _parse_variant_symbol(sym)
@@ -64,6 +92,10 @@ def compute_base_trait_book_for_day(day_book: dict[str, dict]) -> dict[str, dict
             continue
         base_sym, _trait = parsed
         buckets.setdefault(base_sym, []).append((row["close"], row["games"]))
+        if "ci_low" in row:
+            half_widths.setdefault(base_sym, []).append((row["ci_high"] - row["ci_low"]) / 2)
+        else:
+            half_widths.setdefault(base_sym, []).append(None)
 
     base_book: dict[str, dict] = {}
     for base_sym, items in buckets.items():
@@ -77,23 +109,81 @@ def compute_base_trait_book_for_day(day_book: dict[str, dict]) -> dict[str, dict
             else:
                 weighted = sum(closes) / len(closes)
             base_book[base_sym] = {"close": float(weighted), "games": int(total_games)}
+
+            # Contracts are disjoint sets of boards, so their errors combine in quadrature.
+            hws = half_widths[base_sym]
+            if total_games > 0 and None not in hws:
+                hw = sum(((g / total_games) * h) ** 2 for (_c, g), h in zip(items, hws)) ** 0.5
+                base_book[base_sym]["ci_low"] = float(weighted - hw)
+                base_book[base_sym]["ci_high"] = float(weighted + hw)
         else:
             base_book[base_sym] = {"close": float(sum(closes) / len(closes)), "games": None}
 
     return base_book
 
 
-def get_latest_base_traits_sorted(min_games: int = 1) -> list[tuple[str, float, int | None]]:
-    history = load_history()
+_snapshot_cache: dict = {"key": None, "snapshot": None}
+
+
+def write_latest_snapshot(history: dict) -> dict | None:
     day = latest_day(history)
     if not day:
-        return []
+        return None
 
     day_book = _normalize_day_book(history[day])
-    base_book = compute_base_trait_book_for_day(day_book)
+    snapshot = {
+        "day": day,
+        "book": day_book,
+        "base_book": compute_base_trait_book_for_day(day_book),
+    }
+
+    atomic_write_json(LATEST_BOOK_PATH, snapshot)
+    _snapshot_cache["key"] = file_key(LATEST_BOOK_PATH)
+    _snapshot_cache["snapshot"] = snapshot
+
+    return snapshot
+
+
+def _read_fresh_snapshot() -> dict | None:
+    # Trusted only while it is at least as new as market_history.json and its journal.
+    hist_mtime = _history_store.mtime_ns()
+    if hist_mtime is None:
+        return None
+
+    snap_key = file_key(LATEST_BOOK_PATH)
+    if snap_key is not None and snap_key[0] >= hist_mtime:
+        # Parsed once per file version; callers must treat the result as read-only.
+        if _snapshot_cache["key"] == snap_key:
+            return _snapshot_cache["snapshot"]
+        try:
+            with open(LATEST_BOOK_PATH, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            _snapshot_cache["key"] = snap_key
+            _snapshot_cache["snapshot"] = snapshot
+            return snapshot
+        except (OSError, ValueError):
+            pass
+
+    return None
+
+
+def load_latest_snapshot() -> dict | None:
+    snapshot = _read_fresh_snapshot()
+    if snapshot is not None or _history_store.mtime_ns() is None:
+        return snapshot
+
+    # Rebuild under the history lock so a collector commit cannot land between reading
+    # the history and writing the snapshot (which would leave a stale but newer file).
+    return _history_store.read_locked(lambda history: _read_fresh_snapshot() or write_latest_snapshot(history))
+
+
+def get_latest_base_traits_sorted(min_games: int = 1) -> list[tuple[str, float, int | None]]:
+    snapshot = load_latest_snapshot()
+    if not snapshot:
+        return []
 
     rows = []
-    for sym, row in base_book.items():
+    for sym, row in snapshot["base_book"].items():
         games = row["games"]
         if games is not None and games < min_games:
             continue
@@ -104,12 +194,11 @@ def get_latest_base_traits_sorted(min_games: int = 1) -> list[tuple[str, float,
 
 
 def get_variants_for_base_on_latest_day(base_symbol: str, min_games: int = 1) -> list[tuple[str, float, int | None]]:
-    history = load_history()
-    day = latest_day(history)
-    if not day:
+    snapshot = load_latest_snapshot()
+    if not snapshot:
         return []
 
-    day_book = _normalize_day_book(history[day])
+    day_book = snapshot["book"]
     trait = base_symbol.replace("/", "").replace(":XCOMP", "")
 
     rows = []
@@ -130,6 +219,19 @@ def get_variants_for_base_on_latest_day(base_symbol: str, min_games: int = 1) ->
     return rows
 
 
+def get_latest_confidence_intervals() -> dict[str, tuple[float, float]]:
+    snapshot = load_latest_snapshot()
+    if not snapshot:
+        return {}
+
+    out = {}
+    for book in (snapshot["book"], snapshot["base_book"]):
+        for sym, row in book.items():
+            if row.get("ci_low") is not None and row.get("ci_high") is not None:
+                out[sym] = (row["ci_low"], row["ci_high"])
+    return out
+
+
 def series_for_symbol(symbol: str) -> list[tuple[str, float, int | None]]:
     history = load_history()
     days = list_days(history)
@@ -159,12 +261,5 @@ def upsert_day_book(symbol_to_row: dict, day: str | None = None) -> str:
     if day is None:
         day = datetime.date.today().isoformat()
 
-    history = load_history()
-    history.setdefault(day, {})
-    history[day].update(symbol_to_row)
-
-    os.makedirs(os.path.dirname(MARKET_HISTORY_PATH) or ".", exist_ok=True)
-    with open(MARKET_HISTORY_PATH, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
-
+    _history_store.append({"op": "upsert", "day": day, "rows": symbol_to_row}, on_commit=write_latest_snapshot)
     return day
\ No newline at end of file
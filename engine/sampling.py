@@ -0,0 +1,121 @@
+from engine.comp_builder import comp_symbol_from_participant
+from engine.stats_engine import CompStatsAccumulator, close_standard_errors
+
+
+class AdaptiveScheduler:
+    # Decides which match id list / match to fetch next and when the day's sample is good enough.
+    def __init__(
+        self,
+        puuids: list[str],
+        top_n_traits: int,
+        target_se: float,
+        board_coverage: float,
+        min_matches: int,
+        max_matches: int | None = None,
+        lookahead: int = 100,
+        under_bonus: float = 1.0,
+        tail_margin: float = 0.25,
+    ):
+        self.top_n_traits = top_n_traits
+        self.target_se = target_se
+        self.board_coverage = board_coverage
+        self.min_matches = min_matches
+        self.max_matches = max_matches
+        self.lookahead = lookahead
+        self.under_bonus = under_bonus
+        self.tail_margin = tail_margin
+
+        self.ladder = set(puuids)
+        self.players = list(puuids)          # players whose id lists are not fetched yet
+        self.times_seen: dict[str, int] = {p: 0 for p in puuids}
+        self.listed_by: dict[str, set[str]] = {}
+        self.fetched: set[str] = set()
+
+        self.last_comp: dict[str, str] = {}  # ladder player -> comp played in their latest fetched match
+        self.under_sampled: set[str] = set()
+        self.recent_new: list[int] = []      # new ids brought by the latest id lists
+        self.id_calls = 0
+        self.match_calls = 0
+
+    def wants_ids(self) -> bool:
+        return bool(self.players) and len(self.listed_by) < self.lookahead
+
+    def next_player(self) -> str | None:
+        if not self.players:
+            return None
+        # Players already seen in many fetched lobbies mostly list matches we have; try fresh ones first.
+        best = min(range(len(self.players)), key=lambda i: (self.times_seen[self.players[i]], i))
+        return self.players.pop(best)
+
+    def add_id_list(self, puuid: str, ids: list[str]) -> int:
+        self.id_calls += 1
+        new = 0
+        for mid in ids:
+            if mid in self.fetched:
+                continue
+            if mid not in self.listed_by:
+                new += 1
+            self.listed_by.setdefault(mid, set()).add(puuid)
+        self.recent_new = (self.recent_new + [new])[-10:]
+        return new
+
+    def progress(self) -> float:
+        # Share of the full walk's matches fetched so far, assuming the players left bring as many
+        # new ids as the latest id lists did.
+        known = len(self.fetched) + len(self.listed_by)
+        rate = sum(self.recent_new) / len(self.recent_new) if self.recent_new else 0.0
+        expected = known + len(self.players) * rate
+        return len(self.fetched) / expected if expected else 1.0
+
+    def _priority(self, mid: str) -> float:
+        listers = self.listed_by[mid]
+        under = sum(1 for p in listers if self.last_comp.get(p) in self.under_sampled)
+        return len(listers) + self.under_bonus * under
+
+    def next_match(self) -> str | None:
+        if not self.listed_by:
+            return None
+        if self.max_matches is not None and self.match_calls >= self.max_matches:
+            return None
+        mid = max(self.listed_by, key=self._priority)
+        del self.listed_by[mid]
+        return mid
+
+    def record_match(self, mid: str, match: dict):
+        self.match_calls += 1
+        self.fetched.add(mid)
+        for p in match["info"]["participants"]:
+            puuid = p.get("puuid")
+            if puuid not in self.ladder:
+                continue
+            self.times_seen[puuid] += 1
+            self.last_comp[puuid] = comp_symbol_from_participant(p, top_n_traits=self.top_n_traits)
+
+    def check_precision(self, acc: CompStatsAccumulator, min_games: int) -> tuple[bool, float, int, int]:
+        stats = acc.stats()
+        se = close_standard_errors(stats)
+        progress = max(self.progress(), 1e-9)
+
+        priced_boards = 0
+        confident_boards = 0
+        self.under_sampled = set()
+        near = 0
+        for sym, s in stats.items():
+            games = s["games"]
+            # Headed for the book on a full walk but not yet safely above the cut: stopping now
+            # would drop it or leave it priced on a handful of boards.
+            projected = games / progress
+            if projected >= min_games and games < min_games * (1 + self.tail_margin):
+                near += 1
+            if games < min_games:
+                self.under_sampled.add(sym)
+                continue
+            priced_boards += games
+            if se[sym] <= self.target_se:
+                confident_boards += games
+            else:
+                self.under_sampled.add(sym)
+
+        coverage = confident_boards / priced_boards if priced_boards else 0.0
+        done = self.match_calls >= self.min_matches and coverage >= self.board_coverage and not near
+        return done, coverage, len(self.under_sampled), near
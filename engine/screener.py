@@ -0,0 +1,105 @@
+import numpy as np
+
+from engine.market_matrix import MarketMatrix, get_market_matrix
+
+METRICS = {
+    "change": "N-day change %",
+    "volatility": "Volatility % (std of daily returns)",
+    "games_growth": "Games growth %",
+    "ma_distance": "Distance from N-day MA %",
+}
+
+
+def _pct(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = (a - b) / b * 100.0
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def _metric_values(m: MarketMatrix, metric: str, lookback: int) -> np.ndarray:
+    n_days = len(m.days)
+    last = n_days - 1
+    ref = max(last - lookback, 0)
+
+    if metric == "change":
+        return _pct(m.close[last], m.close[ref])
+
+    if metric == "games_growth":
+        return _pct(m.games[last], m.games[ref])
+
+    window = m.close[ref:]
+
+    if metric == "volatility":
+        # A sample std needs two returns, so N=1 still looks back over the last two.
+        window = m.close[max(last - max(lookback, 2), 0):]
+        rets = _pct(window[1:], window[:-1])
+        valid = np.sum(~np.isnan(rets), axis=0)
+        out = np.full(rets.shape[1], np.nan)
+        ok = valid >= 2
+        if ok.any():
+            out[ok] = np.nanstd(rets[:, ok], axis=0, ddof=1)
+        return out
+
+    if metric == "ma_distance":
+        valid = np.sum(~np.isnan(window), axis=0)
+        ma = np.full(window.shape[1], np.nan)
+        ok = valid > 0
+        if ok.any():
+            ma[ok] = np.nanmean(window[:, ok], axis=0)
+        return _pct(m.close[last], ma)
+
+    raise ValueError(f"Unknown screener metric: {metric}")
+
+
+def screen(
+    metric: str = "change",
+    lookback: int = 1,
+    min_games: int = 1,
+    exchange: str | None = "XCOMP",
+    kind: str = "all",
+    query: str = "",
+    descending: bool = True,
+    limit: int | None = None,
+    matrix: MarketMatrix | None = None,
+) -> list[tuple[str, float, float, int | None]]:
+    m = matrix if matrix is not None else get_market_matrix()
+    if not m.days or not m.symbols:
+        return []
+
+    values = _metric_values(m, metric, max(int(lookback), 1))
+    close = m.close[-1]
+    games = m.games[-1]
+
+    mask = ~np.isnan(values) & ~np.isnan(close)
+    mask &= np.isnan(games) | (games >= min_games)
+    if exchange:
+        mask &= m.exchange == exchange
+    if kind == "base":
+        mask &= m.is_base
+    elif kind == "contract":
+        mask &= ~m.is_base
+    if query:
+        q = query.strip().upper()
+        mask &= np.array([q in s.upper() for s in m.symbols], dtype=bool)
+
+    idx = np.flatnonzero(mask)
+    order = np.argsort(values[idx], kind="stable")
+    if descending:
+        order = order[::-1]
+    idx = idx[order]
+    if limit is not None:
+        idx = idx[:limit]
+
+    rows = []
+    for j in idx:
+        g = games[j]
+        rows.append((m.symbols[j], float(values[j]), float(close[j]), None if np.isnan(g) else int(g)))
+    return rows
+
+
+def top_movers(lookback: int = 1, n: int = 10, min_games: int = 1) -> tuple[list, list]:
+    m = get_market_matrix()
+    gainers = screen("change", lookback, min_games, descending=True, limit=n, matrix=m)
+    losers = screen("change", lookback, min_games, descending=False, limit=n, matrix=m)
+    return gainers, losers
@@ -1,25 +1,136 @@
 from collections import defaultdict
+from statistics import NormalDist
+
+import numpy as np
+
 from engine.comp_builder import comp_symbol_from_participant
+from engine.pricing import price_from_w4p
 
-def aggregate_comp_stats(matches: list[dict], top_n_traits: int):
-    stats = defaultdict(lambda: {"games": 0, "wins": 0, "top4": 0})
-    total_boards = 0
 
-    for match in matches:
+class CompStatsAccumulator:
+    # Running per-symbol counters; each match is folded in once, so stats are never re-aggregated.
+    def __init__(self, top_n_traits: int):
+        self.top_n_traits = top_n_traits
+        self.counters = defaultdict(lambda: {"games": 0, "wins": 0, "top4": 0})
+        self.total_boards = 0
+        self.matches = 0
+
+    def add_match(self, match: dict) -> set[str]:
+        touched = set()
         for p in match["info"]["participants"]:
-            total_boards += 1
-            sym = comp_symbol_from_participant(p, top_n_traits=top_n_traits)
-            stats[sym]["games"] += 1
+            self.total_boards += 1
+            sym = comp_symbol_from_participant(p, top_n_traits=self.top_n_traits)
+            c = self.counters[sym]
+            c["games"] += 1
 
             placement = p.get("placement", 8)
             if placement == 1:
-                stats[sym]["wins"] += 1
+                c["wins"] += 1
             if placement <= 4:
-                stats[sym]["top4"] += 1
+                c["top4"] += 1
+            touched.add(sym)
+
+        self.matches += 1
+        return touched
+
+    def stats_for(self, sym: str) -> dict:
+        c = self.counters[sym]
+        s = dict(c)
+        s["win_rate"] = c["wins"] / c["games"]
+        s["top4_rate"] = c["top4"] / c["games"]
+        s["pick_rate"] = c["games"] / self.total_boards if self.total_boards else 0.0
+        return s
+
+    def stats(self) -> dict:
+        return {sym: self.stats_for(sym) for sym in self.counters}
+
+    def book(self, min_games: int, symbols=None) -> dict[str, dict]:
+        out = {}
+        for sym in (self.counters if symbols is None else symbols):
+            c = self.counters.get(sym)
+            if not c or c["games"] < min_games:
+                continue
+            s = self.stats_for(sym)
+            out[sym] = {"close": price_from_w4p(s["win_rate"], s["top4_rate"], s["pick_rate"]), "games": s["games"]}
+        return out
+
+
+def aggregate_comp_stats(matches: list[dict], top_n_traits: int):
+    acc = CompStatsAccumulator(top_n_traits)
+    for match in matches:
+        acc.add_match(match)
+    return acc.stats()
+
+
+def _w4p_arrays(stats: dict, symbols: list[str]):
+    games = np.array([stats[s]["games"] for s in symbols], dtype=np.int64)
+    wins = np.array([stats[s]["wins"] for s in symbols], dtype=np.int64)
+    top4 = np.array([stats[s]["top4"] for s in symbols], dtype=np.int64)
+    pick = np.array([stats[s]["pick_rate"] for s in symbols], dtype=float)
+    return games, wins, top4, pick
+
+
+def close_standard_errors(stats: dict, symbols: list[str] | None = None) -> dict[str, float]:
+    # Delta method on the per-board payoff X = 50*[1st] + 30*[top4]; pick_rate is treated as fixed.
+    if symbols is None:
+        symbols = list(stats.keys())
+    if not symbols:
+        return {}
+
+    games, wins, top4, _pick = _w4p_arrays(stats, symbols)
+    n = np.maximum(games, 1)
+    p1 = wins / n
+    p4 = top4 / n
+    mean = 50 * p1 + 30 * p4
+    var = np.maximum(5500 * p1 + 900 * p4 - mean**2, 0.0)
+    se = np.sqrt(var / n)
+    return dict(zip(symbols, se.tolist()))
+
+
+def close_confidence_intervals(
+    stats: dict,
+    method: str = "bootstrap",
+    level: float = 0.95,
+    n_boot: int = 2000,
+    seed: int | None = None,
+    chunk_size: int = 1024,
+) -> dict[str, tuple[float, float]]:
+    symbols = [s for s, row in stats.items() if row["games"] > 0]
+    if not symbols:
+        return {}
+
+    if method == "analytic":
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        se = close_standard_errors(stats, symbols)
+        out = {}
+        for s in symbols:
+            close = price_from_w4p(stats[s]["win_rate"], stats[s]["top4_rate"], stats[s]["pick_rate"])
+            out[s] = (close - z * se[s], close + z * se[s])
+        return out
+
+    if method != "bootstrap":
+        raise ValueError(f"Unknown confidence interval method: {method}")
+
+    # Placements only enter the price through {1st}, {2nd-4th}, {5th-8th}, so resampling a
+    # symbol's boards is a 3-way multinomial, drawn as two chained binomials for all symbols at once.
+    rng = np.random.default_rng(seed)
+    games, wins, top4, pick = _w4p_arrays(stats, symbols)
+    q = [50 - 50 * level, 50 + 50 * level]
+
+    lo = np.empty(len(symbols))
+    hi = np.empty(len(symbols))
+    for start in range(0, len(symbols), chunk_size):
+        sl = slice(start, start + chunk_size)
+        n = games[sl]
+        p1 = wins[sl] / n
+        rest = n - wins[sl]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p24 = np.where(rest > 0, (top4[sl] - wins[sl]) / rest, 0.0)
+
+        w = rng.binomial(n, p1, size=(n_boot, len(n)))
+        t = w + rng.binomial(n - w, p24)
+        closes = price_from_w4p(w / n, t / n, pick[sl])
 
-    for sym, s in stats.items():
-        s["win_rate"] = s["wins"] / s["games"]
-        s["top4_rate"] = s["top4"] / s["games"]
-        s["pick_rate"] = s["games"] / total_boards if total_boards else 0.0
+        lo[sl], hi[sl] = np.percentile(closes, q, axis=0)
 
-    return dict(stats)
\ No newline at end of file
+    return {s: (float(a), float(b)) for s, a, b in zip(symbols, lo, hi)}
\ No newline at end of file
@@ -0,0 +1,86 @@
+import datetime
+import json
+import os
+import time
+
+from config import TICK_BAR_SECONDS, TICKS_DIR
+
+
+def tick_path(day: str | None = None) -> str:
+    if day is None:
+        day = datetime.date.today().isoformat()
+    return os.path.join(TICKS_DIR, f"{day}.jsonl")
+
+
+def append_ticks(symbol_to_row: dict, ts: float | None = None, day: str | None = None) -> int:
+    if not symbol_to_row:
+        return 0
+    if ts is None:
+        ts = time.time()
+
+    lines = []
+    for sym, row in symbol_to_row.items():
+        lines.append(json.dumps({"ts": round(ts, 3), "symbol": sym, "close": row["close"], "games": row["games"]}))
+
+    os.makedirs(TICKS_DIR, exist_ok=True)
+    with open(tick_path(day), "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return len(lines)
+
+
+class TickTail:
+    # Follows one day's tick file from a byte offset and folds new ticks into OHLC bars.
+    def __init__(self, day: str | None = None, bar_seconds: int = TICK_BAR_SECONDS):
+        self.path = tick_path(day)
+        self.bar_seconds = bar_seconds
+        self.offset = 0
+        self.bars: dict[str, dict[int, list]] = {}   # symbol -> {bar_start: [open, high, low, close, games]}
+
+    def poll(self) -> set[str]:
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return set()
+        if size < self.offset:
+            # file was replaced; start over
+            self.offset = 0
+            self.bars = {}
+        if size == self.offset:
+            return set()
+
+        changed = set()
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partially written last line is picked up next poll.
+        end = chunk.rfind(b"\n") + 1
+        self.offset += end
+
+        for raw in chunk[:end].splitlines():
+            try:
+                tick = json.loads(raw)
+            except ValueError:
+                continue
+            self._apply(tick)
+            changed.add(tick["symbol"])
+
+        return changed
+
+    def _apply(self, tick: dict):
+        close = float(tick["close"])
+        start = int(tick["ts"]) // self.bar_seconds * self.bar_seconds
+        sym_bars = self.bars.setdefault(tick["symbol"], {})
+        bar = sym_bars.get(start)
+        if bar is None:
+            sym_bars[start] = [close, close, close, close, tick.get("games")]
+            return
+        bar[1] = max(bar[1], close)
+        bar[2] = min(bar[2], close)
+        bar[3] = close
+        bar[4] = tick.get("games")
+
+    def bars_for_symbol(self, symbol: str) -> list[tuple[int, float, float, float, float, int | None]]:
+        sym_bars = self.bars.get(symbol, {})
+        return [(start, *sym_bars[start]) for start in sorted(sym_bars)]
@@ -1,34 +1,60 @@
-import json
+import atexit
 import os
+from config import JOURNAL_COMPACT_EVERY, JOURNAL_FSYNC_EVERY, JOURNAL_FSYNC_INTERVAL_S
+from engine.journal import JournalStore
 
 WATCHLIST_PATH = os.path.join("data", "watchlist.json")
 
 
+def _decode(data) -> set[str]:
+    if isinstance(data, list):
+        return set(str(x) for x in data)
+    return set()
+
+
+def _apply_watch_op(items: set[str], op: dict) -> None:
+    if op.get("op") == "add":
+        items.add(op["symbol"])
+    elif op.get("op") == "remove":
+        items.discard(op["symbol"])
+
+
+_store = JournalStore(
+    WATCHLIST_PATH,
+    empty=set,
+    decode=_decode,
+    encode=sorted,
+    apply_op=_apply_watch_op,
+    fsync_every=JOURNAL_FSYNC_EVERY,
+    fsync_interval=JOURNAL_FSYNC_INTERVAL_S,
+    compact_every=JOURNAL_COMPACT_EVERY,
+    indent=2,
+    corrupt_as_empty=True,   # as before: a truncated watchlist.json starts an empty watchlist
+)
+
+# Folded back into the tracked watchlist.json when the process exits; only a crash leaves
+# clicks in the (ignored) journal, and the next run picks them up and compacts them.
+atexit.register(_store.compact, if_pending=True)
+
+
 def load_watchlist() -> set[str]:
-    if not os.path.exists(WATCHLIST_PATH):
-        return set()
     try:
-        with open(WATCHLIST_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return set(str(x) for x in data)
-        return set()
+        return set(_store.load())
     except Exception:
         return set()
 
 
 def save_watchlist(items: set[str]) -> None:
-    os.makedirs(os.path.dirname(WATCHLIST_PATH), exist_ok=True)
-    with open(WATCHLIST_PATH, "w", encoding="utf-8") as f:
-        json.dump(sorted(items), f, indent=2)
+    # Journals only the difference; the snapshot is rewritten on compaction.
+    def diff(current: set[str]) -> list[dict]:
+        ops = [{"op": "remove", "symbol": sym} for sym in sorted(current - items)]
+        ops += [{"op": "add", "symbol": sym} for sym in sorted(items - current)]
+        return ops
+
+    _store.update(diff)
 
 
 def toggle_watch(symbol: str) -> bool:
-    wl = load_watchlist()
-    if symbol in wl:
-        wl.remove(symbol)
-        save_watchlist(wl)
-        return False
-    wl.add(symbol)
-    save_watchlist(wl)
-    return True
+    # Decided under the store lock, against what other processes have already written.
+    ops = _store.update(lambda current: [{"op": "remove" if symbol in current else "add", "symbol": symbol}])
+    return ops[0]["op"] == "add"
@@ -0,0 +1,104 @@
+# Offline comparison of the fixed and adaptive fetch loops in collect_daily.py on a
+# synthetic ladder. Nothing is fetched from the API and nothing is written to data/.
+import random
+import sys
+
+import collect_daily
+from config import MATCHES_PER_PLAYER, MIN_GAMES_PER_COMP, TOP_N_TRAITS
+from engine.stats_engine import CompStatsAccumulator
+
+PLAYERS = 200
+MATCHES = 1160     # about 9,300 boards, like a real day of the ladder walk
+LOYALTY = 0.5      # chance a ladder player sticks to their favourite comp in a match
+
+# Boards per comp over a full day, taken from the book of 2026-01-16 (62 priced comps),
+# plus the unpriced tail of comps that never reach MIN_GAMES_PER_COMP.
+PRICED_GAMES = [
+    1128, 781, 693, 626, 336, 312, 299, 297, 237, 233, 231, 226, 219, 196, 190, 188,
+    182, 174, 165, 158, 137, 137, 126, 115, 105, 103, 101, 99, 95, 91, 85, 73,
+    69, 63, 62, 59, 57, 55, 53, 51, 47, 44, 42, 40, 35, 35, 32, 31,
+    29, 29, 29, 28, 28, 27, 26, 24, 24, 22, 20, 20, 20, 20,
+]
+TAIL_GAMES = [18, 17, 15, 14, 12, 11, 10, 9, 8, 7, 6, 6, 5, 4, 4, 3, 3, 2, 2, 1, 1, 1]
+
+
+def build_ladder(seed: int):
+    rng = random.Random(seed)
+    players = [f"p{i}" for i in range(PLAYERS)]
+
+    weights = PRICED_GAMES + TAIL_GAMES
+    comps = [f"TFT_C{i}" for i in range(len(weights))]
+    strength = {c: rng.gauss(0.0, 1.0) for c in comps}
+    favourite = {p: rng.choices(comps, weights)[0] for p in players}
+
+    # Every ladder player lists MATCHES_PER_PLAYER matches of the day; the rest of each lobby is off-ladder.
+    lobbies = {k: [] for k in range(MATCHES)}
+    history = {}
+    for p in players:
+        ks = rng.sample([k for k in lobbies if len(lobbies[k]) < 8], MATCHES_PER_PLAYER)
+        for k in ks:
+            lobbies[k].append(p)
+        history[p] = [f"m{k}" for k in sorted(ks)]
+
+    matches = {}
+    for k, ladder in lobbies.items():
+        seats = ladder + [None] * (8 - len(ladder))
+        picks = [favourite[p] if p and rng.random() < LOYALTY else rng.choices(comps, weights)[0] for p in seats]
+        order = sorted(range(8), key=lambda i: strength[picks[i]] + rng.gauss(0.0, 2.0), reverse=True)
+        participants = []
+        for place, i in enumerate(order, start=1):
+            participants.append(
+                {"puuid": seats[i] or f"x{k}_{i}", "placement": place, "traits": [{"name": picks[i], "num_units": 6}]}
+            )
+        matches[f"m{k}"] = {"info": {"participants": participants}}
+
+    return players, history, matches
+
+
+def run(adaptive: bool, seed: int) -> tuple[dict, dict]:
+    players, history, matches = build_ladder(seed)
+    calls = {"ids": 0, "matches": 0}
+
+    def get_match_ids_by_puuid(puuid: str, count: int):
+        calls["ids"] += 1
+        return history[puuid][-count:]
+
+    def get_match(match_id: str):
+        calls["matches"] += 1
+        return matches[match_id]
+
+    collect_daily.get_match_ids_by_puuid = get_match_ids_by_puuid
+    collect_daily.get_match = get_match
+
+    acc = CompStatsAccumulator(TOP_N_TRAITS)
+    on_match = acc.add_match
+    if adaptive:
+        collect_daily._fetch_adaptive(players, acc, on_match)
+    else:
+        collect_daily._fetch_fixed(players, on_match)
+
+    return calls, acc.book(MIN_GAMES_PER_COMP)
+
+
+def main():
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    results = {mode: run(mode == "adaptive", seed) for mode in ("fixed", "adaptive")}
+
+    print()
+    print(f"seed={seed} players={PLAYERS} matches/player={MATCHES_PER_PLAYER}")
+    for mode, (calls, book) in results.items():
+        total = calls["ids"] + calls["matches"]
+        print(f"{mode:>8}: {calls['ids']} id lists + {calls['matches']} matches = {total} calls, {len(book)} symbols priced")
+
+    fixed, adaptive = results["fixed"][1], results["adaptive"][1]
+    dropped = sorted(set(fixed) - set(adaptive))
+    shared = sorted(set(fixed) & set(adaptive))
+    drift = max((abs(fixed[s]["close"] - adaptive[s]["close"]) for s in shared), default=0.0)
+    print(f"priced by the fixed walk but dropped by the adaptive one: {len(dropped)}")
+    for sym in dropped:
+        print(f"  {sym} ({fixed[sym]['games']} games)")
+    print(f"largest close difference on symbols priced by both: {drift:.2f}")
+
+
+if __name__ == "__main__":
+    main()